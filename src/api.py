@@ -1,32 +1,66 @@
 """
-Flask API for Link Extractor
+Quart API for Link Extractor
 Provides REST API endpoints for extracting links from websites.
+
+Run with an ASGI server, e.g.: uvicorn api:app --workers 4
 """
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+from quart import Quart, request, jsonify
+from quart_cors import cors
+from functools import partial
+import asyncio
 import traceback
-import sys
-import os
-
-# Add current directory to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
+from typing import Optional
 
 from link_extractor import LinkExtractor
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend
+try:
+    import aiohttp
+except ImportError:  # The extractor reports the missing dependency per request
+    aiohttp = None
+
+# Upper bounds on what a single batch request may ask for
+MAX_BATCH_URLS = 100
+MAX_BATCH_CONCURRENCY = 50
+
+# Connections the shared aiohttp session keeps open across all requests
+HTTP_CONNECTION_LIMIT = 100
+
+app = Quart(__name__)
+app = cors(app, allow_origin='*')  # Enable CORS for frontend
+
+# aiohttp session shared by every request in this worker process
+_http_session: Optional['aiohttp.ClientSession'] = None
+
+
+@app.before_serving
+async def open_http_session():
+    """Open the shared aiohttp session once the worker starts serving."""
+    global _http_session
+    if aiohttp is not None:
+        _http_session = LinkExtractor('http://localhost').new_client_session(
+            limit=HTTP_CONNECTION_LIMIT
+        )
+
+
+@app.after_serving
+async def close_http_session():
+    """Close the shared aiohttp session when the worker shuts down."""
+    global _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
 
 
 @app.route('/', methods=['GET'])
-def root():
+async def root():
     """Root endpoint with API information."""
     return jsonify({
         'service': 'Link Extractor API',
         'version': '1.0.0',
         'endpoints': {
             '/api/extract': 'POST - Extract links from a URL',
+            '/api/extract/batch': 'POST - Extract links from several URLs concurrently',
             '/api/health': 'GET - Health check'
         },
         'frontend': 'Open http://localhost:8000 for the web interface',
@@ -35,10 +69,10 @@ def root():
 
 
 @app.route('/api/extract', methods=['POST'])
-def extract_links():
+async def extract_links():
     """Extract links from a given URL."""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         url = data.get('url')
         use_browser = data.get('use_browser', False)
         filter_domain = data.get('filter_domain', False)
@@ -63,15 +97,19 @@ def extract_links():
         if use_browser:
             # Use longer wait time for browser automation (15 seconds default)
             wait_time = data.get('wait_time', 15)
-            links, diagnostics = extractor.extract_links_with_browser(
+            # Selenium is blocking; keep it off the event loop
+            loop = asyncio.get_running_loop()
+            links, diagnostics = await loop.run_in_executor(None, partial(
+                extractor.extract_links_with_browser,
                 filter_domain=filter_domain,
                 include_external=include_external,
                 wait_time=wait_time
-            )
+            ))
         else:
-            links, diagnostics = extractor.get_all_links(
+            links, diagnostics = await extractor.extract_links_async(
                 filter_domain=filter_domain,
-                include_external=include_external
+                include_external=include_external,
+                session=_http_session
             )
         
         links_list = sorted(list(links))
@@ -101,8 +139,80 @@ def extract_links():
         }), 500
 
 
+@app.route('/api/extract/batch', methods=['POST'])
+async def extract_links_batch():
+    """Extract links from several URLs concurrently."""
+    try:
+        data = await request.get_json()
+        urls = data.get('urls')
+        filter_domain = data.get('filter_domain', False)
+        include_external = data.get('include_external', True)
+        timeout = data.get('timeout', 10)
+        max_concurrency = data.get('max_concurrency', 10)
+        
+        if not urls or not isinstance(urls, list):
+            return jsonify({
+                'success': False,
+                'error': 'A non-empty list of URLs is required'
+            }), 400
+        
+        if len(urls) > MAX_BATCH_URLS:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_URLS} URLs are allowed per batch'
+            }), 400
+        
+        if (not isinstance(max_concurrency, int) or isinstance(max_concurrency, bool)
+                or max_concurrency < 1):
+            return jsonify({
+                'success': False,
+                'error': 'max_concurrency must be a positive integer'
+            }), 400
+        max_concurrency = min(max_concurrency, MAX_BATCH_CONCURRENCY)
+        
+        invalid = [u for u in urls if not isinstance(u, str) or not u.startswith(('http://', 'https://'))]
+        if invalid:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid URL format. URL must start with http:// or https://',
+                'invalid_urls': invalid
+            }), 400
+        
+        extractor = LinkExtractor(urls[0], timeout=timeout)
+        results = await extractor.extract_links_batch(
+            urls,
+            filter_domain=filter_domain,
+            include_external=include_external,
+            max_concurrency=max_concurrency,
+            session=_http_session
+        )
+        
+        response = {}
+        for page_url, (links, diagnostics) in results.items():
+            links_list = sorted(list(links))
+            response[page_url] = {
+                'success': not diagnostics.get('error'),
+                'error': diagnostics.get('error'),
+                'links': links_list,
+                'count': len(links_list),
+                'diagnostics': diagnostics
+            }
+        
+        return jsonify({
+            'success': True,
+            'results': response
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'traceback': traceback.format_exc()
+        }), 500
+
+
 @app.route('/api/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return jsonify({
         'status': 'healthy',
@@ -111,5 +221,6 @@ def health_check():
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5001, host='0.0.0.0')
+    import uvicorn
+    uvicorn.run('api:app', host='0.0.0.0', port=5001, workers=4)
 
@@ -0,0 +1,54 @@
+"""
+Async Fetcher Module
+Downloads many web pages concurrently over one shared aiohttp session.
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from link_extractor import LinkExtractor
+
+try:
+    import aiohttp
+except ImportError:  # Only needed for type hints here
+    aiohttp = None
+
+
+async def fetch_many(urls: Sequence[str], timeout: int = 10, limit: int = 50,
+                     session: Optional['aiohttp.ClientSession'] = None
+                     ) -> List[Tuple[Optional[bytes], Dict]]:
+    """
+    Fetch several pages concurrently.
+    
+    A single aiohttp session (and connection pool) is shared by every
+    request in the call instead of opening one per URL.
+    
+    Args:
+        urls: URLs to fetch
+        timeout: Request timeout in seconds, per URL
+        limit: Maximum number of simultaneous connections
+        session: Existing session to reuse across calls; it is left open.
+            When omitted a session is opened (with limit) for this call only
+        
+    Returns:
+        List aligned with urls of (page body or None, diagnostics dictionary)
+    """
+    if not urls:
+        return []
+    
+    fetcher = LinkExtractor(urls[0], timeout=timeout)
+    if session is None:
+        async with fetcher.new_client_session(limit=limit) as own_session:
+            return await fetch_many(urls, timeout, session=own_session)
+    
+    results = await asyncio.gather(
+        *[fetcher.fetch_page_async(session, url) for url in urls],
+        return_exceptions=True
+    )
+    
+    return [
+        (None, {'error': f"Unexpected error: {str(result)}"})
+        if isinstance(result, BaseException) else result
+        for result in results
+    ]
+
@@ -4,14 +4,563 @@ Fetches and extracts all hyperlinks from a given website URL.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from urllib.parse import urljoin, urlparse
-from typing import Set, List, Optional, Dict, Tuple
+from typing import Callable, Set, List, Optional, Dict, Tuple, Iterable
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+import asyncio
+import atexit
+import codecs
+import http.cookiejar
+import os
+import queue
 import re
+import shutil
+import threading
 import time
 import json
 import platform
 
+try:
+    import aiohttp
+except ImportError:  # Async batch extraction is optional
+    aiohttp = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Prefer the C-based lxml parser; fall back to the pure-Python one
+try:
+    from lxml import etree
+    PARSER = 'lxml'
+except ImportError:
+    etree = None
+    PARSER = 'html.parser'
+
+# Size of the response chunks fed to the streaming parser
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# An in-document charset declaration lxml can pick up on its own
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+
+# Byte order marks and the libxml2 encoding names they select; UTF-32 first
+# because its little-endian BOM starts with the UTF-16 one
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'UTF-32LE'),
+    (codecs.BOM_UTF32_BE, 'UTF-32BE'),
+    (codecs.BOM_UTF8, 'UTF-8'),
+    (codecs.BOM_UTF16_LE, 'UTF-16LE'),
+    (codecs.BOM_UTF16_BE, 'UTF-16BE'),
+)
+
+# Only tags that can carry links are turned into Python objects
+STRAINER = SoupStrainer(['a', 'link', 'area', 'script'])
+
+# Absolute URLs embedded in JavaScript source
+_URL_RE = re.compile(r'https?://[^\s"\'<>]+')
+
+# Anchor targets that never point to another page
+_SKIP_PREFIXES = ('javascript:', 'mailto:', 'tel:', '#', 'data:')
+
+# Lower-cased markers of HTML markup that leaked into a URL
+_HTML_ENTITY_TOKENS = ('%22%3e', '%3c/a', 'href%3d')
+
+# JSON-LD properties that hold URLs (or objects/lists containing them)
+_JSONLD_URL_KEYS = ('url', 'sameAs', '@id', 'mainEntityOfPage', 'image', 'logo')
+
+# Characters that must never appear in a host name
+_BAD_NETLOC = str.maketrans('', '', '<>"\'')
+
+# Static assets that crawl() never follows as pages
+_NON_PAGE_EXTENSIONS = (
+    '.css', '.js', '.json', '.xml', '.png', '.jpg', '.jpeg', '.gif', '.webp',
+    '.svg', '.ico', '.woff', '.woff2', '.ttf', '.pdf', '.zip', '.mp4', '.mp3',
+)
+
+# Upper bound on memoized _clean_url() results
+_CLEAN_CACHE_LIMIT = 10000
+
+# Complete User-Agent string to avoid blocking
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(user_agent: str = DEFAULT_USER_AGENT) -> requests.Session:
+    """
+    Return the shared HTTP session for a User-Agent.
+    
+    Sessions are shared across LinkExtractor instances so that repeat
+    requests to the same host reuse pooled keep-alive connections instead
+    of paying for a new TCP/TLS handshake each time. The cookie jar
+    refuses every cookie, so one caller's cookies never reach another.
+    
+    Args:
+        user_agent: User-Agent header the session sends
+        
+    Returns:
+        Connection-pooled requests.Session
+    """
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(user_agent)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=2,
+                    # Surface read timeouts at once: retrying a slow server only
+                    # multiplies the wait and turns the error into a
+                    # connection error
+                    read=False,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False
+                )
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            # Redirect chains still carry cookies on the per-request jar
+            session.cookies.set_policy(
+                http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            )
+            session.headers.update({
+                'User-Agent': user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1'
+            })
+            _SESSIONS[user_agent] = session
+        return session
+
+
+# Returns [document.readyState, number of anchors] in a single round-trip
+_SETTLE_SCRIPT = "return [document.readyState, document.getElementsByTagName('a').length];"
+
+# How long the anchor count must stay unchanged before a page counts as rendered
+_SETTLE_SECONDS = 1.0
+
+# Subresources the browser never needs to download to discover links
+_BLOCKED_RESOURCES = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.css',
+]
+
+# Warm headless Chrome instances kept between browser extractions
+_DRIVER_POOL_SIZE = 4
+_DRIVER_POOL: 'queue.Queue' = queue.Queue(maxsize=_DRIVER_POOL_SIZE)
+
+
+def _spawn_driver(user_agent: str = DEFAULT_USER_AGENT):
+    """
+    Launch a new headless Chrome instance.
+    
+    Args:
+        user_agent: User-Agent the browser reports
+        
+    Returns:
+        Tuple of (WebDriver, name of the ChromeDriver source used)
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    # Setup Chrome options
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # Run in background
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument(f'user-agent={user_agent}')
+    # Links only need HTML and JavaScript; skip downloading images
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2
+    })
+    
+    # Set Chrome binary location for macOS
+    if platform.system().lower() == 'darwin':
+        chrome_binary = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+        if os.path.exists(chrome_binary):
+            chrome_options.binary_location = chrome_binary
+    
+    # Check common ChromeDriver locations
+    common_paths = [
+        '/opt/homebrew/bin/chromedriver',  # Homebrew on Apple Silicon
+        '/usr/local/bin/chromedriver',      # Homebrew on Intel Mac
+        shutil.which('chromedriver'),       # System PATH
+    ]
+    
+    # Remove None values
+    common_paths = [p for p in common_paths if p and os.path.exists(p)]
+    
+    driver = None
+    source = None
+    
+    # Try system ChromeDriver first (faster and more reliable)
+    for path in common_paths:
+        try:
+            driver = webdriver.Chrome(service=Service(path), options=chrome_options)
+            source = 'system'
+            break
+        except Exception:
+            continue
+    
+    # If system ChromeDriver doesn't work, try ChromeDriverManager
+    if driver is None:
+        try:
+            driver_path = ChromeDriverManager().install()
+            driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+            source = 'webdriver-manager'
+        except Exception as e1:
+            # Last resort: try without specifying service
+            try:
+                driver = webdriver.Chrome(options=chrome_options)
+                source = 'auto-detect'
+            except Exception as e2:
+                error_msg = f"ChromeDriver setup failed. Tried system paths and webdriver-manager. "
+                error_msg += f"Errors: {str(e1)} / {str(e2)}. "
+                error_msg += "If ChromeDriver is installed, ensure it's in PATH or try: brew install chromedriver"
+                raise Exception(error_msg)
+    
+    # Block the remaining heavy subresources at the network layer; the
+    # setting lives on the browser tab, so it survives pooling
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_RESOURCES})
+    except Exception:
+        pass  # Not fatal; pages just load slower
+    
+    return driver, source
+
+
+def _get_driver():
+    """
+    Check out a browser, reusing a warm pooled one when available.
+    
+    Returns:
+        Tuple of (WebDriver, name of the ChromeDriver source used)
+    """
+    try:
+        return _DRIVER_POOL.get_nowait(), 'pool'
+    except queue.Empty:
+        return _spawn_driver()
+
+
+def _release_driver(driver) -> None:
+    """Reset a browser and return it to the pool, or quit it if that fails."""
+    try:
+        # delete_all_cookies() only covers the current page's domain; the
+        # pool is shared between callers, so wipe every origin's cookies
+        # and the storage of the page that was open
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        origin = urlparse(driver.current_url)
+        if origin.scheme in ('http', 'https'):
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': f'{origin.scheme}://{origin.netloc}',
+                'storageTypes': 'all'
+            })
+        driver.get('about:blank')
+        _DRIVER_POOL.put_nowait(driver)
+        return
+    except queue.Full:
+        pass
+    except Exception:
+        pass  # Broken session; don't hand it out again
+    try:
+        driver.quit()
+    except Exception:
+        pass  # Ignore errors when closing driver
+
+
+@atexit.register
+def _shutdown_drivers() -> None:
+    """Quit every pooled browser when the interpreter exits."""
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def _is_valid_url(url: str) -> bool:
+    """
+    Validate if a URL is properly formatted and not malformed.
+    
+    Args:
+        url: URL to validate
+        
+    Returns:
+        True if URL is valid, False otherwise
+    """
+    try:
+        parsed = urlparse(url)
+        
+        # Must have scheme and netloc
+        if not parsed.scheme or not parsed.netloc:
+            return False
+        
+        # Scheme must be http or https
+        if parsed.scheme not in ['http', 'https']:
+            return False
+        
+        # Check for malformed patterns
+        # URLs with HTML entities encoded (like %22%3E, %3C/a%3E)
+        # Normal URL encoding like %20 for spaces is allowed
+        url_low = url.lower()
+        if any(token in url_low for token in _HTML_ENTITY_TOKENS):
+            return False
+        
+        # Check for multiple URLs concatenated (scheme repeated after the first one)
+        scheme_prefix = parsed.scheme + '://'
+        if url.find(scheme_prefix, len(scheme_prefix)) != -1:
+            return False
+        
+        # Check for URLs that are too long (likely malformed)
+        if len(url) > 2000:
+            return False
+        
+        # Check for invalid characters in domain
+        if parsed.netloc.translate(_BAD_NETLOC) != parsed.netloc:
+            return False
+        
+        # Basic sanity check - URL should be reasonable
+        return True
+        
+    except Exception:
+        return False
+
+
+# Nav menus and footers repeat the same hrefs, so memoize cleaning
+@lru_cache(maxsize=_CLEAN_CACHE_LIMIT)
+def _clean_url(url: str) -> Optional[str]:
+    """
+    Clean and normalize a URL.
+    
+    Args:
+        url: URL to clean
+        
+    Returns:
+        Cleaned URL or None if invalid
+    """
+    try:
+        # Remove fragments
+        url = url.split('#')[0]
+        
+        # Remove trailing slashes (except for root)
+        if url.endswith('/') and urlparse(url).path != '/':
+            url = url.rstrip('/')
+        
+        # Validate the URL
+        if not _is_valid_url(url):
+            return None
+        
+        return url
+    except Exception:
+        return None
+
+
+def _normalize_href(href: Optional[str], base: str, base_netloc: str,
+                    include_external: bool,
+                    _skip: Tuple[str, ...] = _SKIP_PREFIXES) -> Optional[str]:
+    """
+    Turn an anchor's href into a clean absolute URL.
+    
+    Args:
+        href: Raw href attribute value
+        base: URL of the page the anchor was found on
+        base_netloc: Host of the site being extracted
+        include_external: If False, drop URLs on other hosts
+        
+    Returns:
+        Cleaned absolute URL, or None if the href should be skipped
+    """
+    if not href:
+        return None
+    # Only copy the string when there is whitespace to strip
+    if href[0].isspace() or href[-1].isspace():
+        href = href.strip()
+    # Skip empty, javascript:, mailto:, tel:, and fragment-only links
+    if not href or href.startswith(_skip):
+        return None
+    
+    try:
+        cleaned_url = _clean_url(urljoin(base, href))
+    except ValueError:
+        return None
+    if cleaned_url and (include_external or urlparse(cleaned_url).netloc == base_netloc):
+        return cleaned_url
+    return None
+
+
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool used to parse pages off the event loop."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _PARSE_POOL
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken parse pool so the next _get_parse_pool() starts a fresh one."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+    pool.shutdown(wait=False)
+
+
+def _parse_and_extract(body: bytes, page_url: str, base_url: str,
+                       filter_domain: bool, include_external: bool,
+                       encoding: Optional[str] = None) -> Tuple[Set[str], Dict]:
+    """
+    Parse a downloaded page in a worker process.
+    
+    Args:
+        body: Raw page bytes
+        page_url: Final URL of the page, used to resolve relative links
+        base_url: Base URL of the extractor, used for domain filtering
+        filter_domain: If True, only include links from the same domain
+        include_external: If True, include external links
+        encoding: Charset declared by the server, if any
+        
+    Returns:
+        Tuple of (Set of unique URLs, parsing diagnostics)
+    """
+    # Parsing only needs the base URL, so skip __init__ rather than set up
+    # an HTTP session in every worker process
+    extractor = LinkExtractor.__new__(LinkExtractor)
+    extractor.base_url = base_url.rstrip('/')
+    extractor._base_netloc = urlparse(extractor.base_url).netloc
+    
+    diagnostics = {}
+    links = extractor._parse_links(
+        body, page_url, filter_domain, include_external, diagnostics, encoding
+    )
+    return links, diagnostics
+
+
+def _collect_json_ld_urls(node, links: Set[str], depth: int = 0) -> None:
+    """
+    Add URLs found in a decoded JSON-LD node to links.
+    
+    Only the properties listed in _JSONLD_URL_KEYS (and @graph containers)
+    are followed, so large descriptive branches are never walked.
+    """
+    if depth > 8:
+        return
+    if isinstance(node, str):
+        if node.startswith('http'):
+            links.add(node.split('#')[0])
+    elif isinstance(node, list):
+        for item in node:
+            _collect_json_ld_urls(item, links, depth + 1)
+    elif isinstance(node, dict):
+        for key in _JSONLD_URL_KEYS:
+            value = node.get(key)
+            if value is not None:
+                _collect_json_ld_urls(value, links, depth + 1)
+        graph = node.get('@graph')
+        if graph is not None:
+            _collect_json_ld_urls(graph, links, depth + 1)
+
+
+class _StreamingLinkParser:
+    """
+    Feeds page chunks to lxml's pull parser as they arrive.
+    
+    Used by both the synchronous and the aiohttp code paths, so neither has
+    to hold the whole response body in memory before parsing starts.
+    """
+    
+    def __init__(self, extractor: 'LinkExtractor', page_url: str,
+                 filter_domain: bool, include_external: bool,
+                 encoding: Optional[str] = None):
+        self.extractor = extractor
+        self.page_url = page_url
+        self.filter_domain = filter_domain
+        self.include_external = include_external
+        self.encoding = encoding
+        self.links: Set[str] = set()
+        self.anchors_found = 0
+        self.size = 0
+        self._parser = None
+    
+    def _new_parser(self, first_chunk):
+        """Create the lxml parser once the first chunk reveals the input type."""
+        # huge_tree lifts libxml2's nesting limit (about 256 levels), past
+        # which it silently stops reporting elements
+        if not isinstance(first_chunk, bytes):
+            return etree.HTMLPullParser(events=('end',), huge_tree=True)
+        
+        # A byte order mark overrides any declared charset
+        encoding = next(
+            (name for bom, name in _BOM_ENCODINGS if first_chunk.startswith(bom)),
+            self.encoding
+        )
+        # Without a declared charset fall back to UTF-8 rather than
+        # libxml2's ISO-8859-1 default
+        if encoding is None and not _META_CHARSET_RE.search(first_chunk, 0, 4096):
+            encoding = 'utf-8'
+        try:
+            return etree.HTMLPullParser(events=('end',), encoding=encoding, huge_tree=True)
+        except LookupError:
+            return etree.HTMLPullParser(events=('end',), huge_tree=True)
+    
+    def feed(self, chunk) -> None:
+        """Parse one more chunk of the page."""
+        if not chunk:
+            return
+        if self._parser is None:
+            self._parser = self._new_parser(chunk)
+        self.size += len(chunk)
+        self._parser.feed(chunk)
+        self._drain()
+    
+    def close(self) -> Set[str]:
+        """Flush the parser and return the links collected so far."""
+        if self._parser is not None:
+            self._parser.close()
+            self._drain()
+        return self.links
+    
+    def _drain(self) -> None:
+        self.anchors_found += self.extractor._links_from_events(
+            self._parser, self.page_url, self.filter_domain,
+            self.include_external, self.links
+        )
+    
+    def record(self, diagnostics: Dict) -> None:
+        """Store parsing statistics in a diagnostics dictionary."""
+        diagnostics['content_length'] = self.size
+        diagnostics['anchor_tags_found'] = self.anchors_found
+        diagnostics['unique_links_found'] = len(self.links)
+        diagnostics['success'] = True
+
 
 class LinkExtractor:
     """Extracts hyperlinks from web pages."""
@@ -25,26 +574,21 @@ class LinkExtractor:
             timeout: Request timeout in seconds (default: 10)
         """
         self.base_url = base_url.rstrip('/')
+        self._base_netloc = urlparse(self.base_url).netloc
         self.timeout = timeout
-        self.session = requests.Session()
-        # Complete User-Agent string to avoid blocking
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
+        self.session = _get_session()
         self.last_error = None
         self.diagnostics = {}
     
-    def fetch_page(self, url: str) -> Tuple[Optional[requests.Response], Optional[str]]:
+    def fetch_page(self, url: str,
+                   stream: bool = False) -> Tuple[Optional[requests.Response], Optional[str]]:
         """
         Fetch a web page with better error handling.
         
         Args:
             url: URL to fetch
+            stream: If True, leave the body unread so it can be consumed in
+                chunks; the caller must close the response
             
         Returns:
             Tuple of (Response object or None, error message or None)
@@ -55,29 +599,29 @@ class LinkExtractor:
                 url, 
                 timeout=self.timeout,
                 allow_redirects=True,
-                verify=True
+                verify=True,
+                stream=stream
             )
             
             # Store diagnostics
             self.diagnostics = {
                 'status_code': response.status_code,
-                'content_length': len(response.content),
                 'content_type': response.headers.get('Content-Type', 'unknown'),
                 'final_url': response.url,
                 'redirected': response.url != url
             }
+            if not stream:
+                self.diagnostics['content_length'] = len(response.content)
             
             # Check for common blocking indicators
-            if response.status_code == 403:
-                self.last_error = "Access forbidden (403). The website may be blocking automated requests."
-                return None, self.last_error
-            elif response.status_code == 401:
-                self.last_error = "Unauthorized (401). The website may require authentication."
-                return None, self.last_error
-            elif response.status_code == 404:
-                self.last_error = "Page not found (404)."
+            status_error = self._status_error(response.status_code)
+            if status_error:
+                response.close()
+                self.last_error = status_error
                 return None, self.last_error
             
+            if not response.ok:
+                response.close()
             response.raise_for_status()
             return response, None
             
@@ -97,6 +641,266 @@ class LinkExtractor:
             self.last_error = f"Unexpected error: {str(e)}"
             return None, self.last_error
     
+    @staticmethod
+    def _status_error(status_code: int) -> Optional[str]:
+        """Map common blocking status codes to a readable error message."""
+        if status_code == 403:
+            return "Access forbidden (403). The website may be blocking automated requests."
+        elif status_code == 401:
+            return "Unauthorized (401). The website may require authentication."
+        elif status_code == 404:
+            return "Page not found (404)."
+        return None
+    
+    def new_client_session(self, limit: int = 20) -> 'aiohttp.ClientSession':
+        """
+        Create an aiohttp session sharing this extractor's headers.
+        
+        The caller owns the session and must close it (e.g. with
+        ``async with``); it can be passed to fetch_page_async(),
+        extract_links_async() and extract_links_batch().
+        
+        Args:
+            limit: Maximum number of simultaneous connections
+            
+        Returns:
+            aiohttp.ClientSession with a DNS-caching connector
+        """
+        connector = aiohttp.TCPConnector(limit=limit, ttl_dns_cache=300)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(self.session.headers)
+        )
+    
+    async def fetch_page_async(self, session: 'aiohttp.ClientSession', url: str,
+                               stream_parser: Optional[_StreamingLinkParser] = None
+                               ) -> Tuple[Optional[bytes], Dict]:
+        """
+        Fetch a web page asynchronously.
+        
+        Args:
+            session: aiohttp session to issue the request with
+            url: URL to fetch
+            stream_parser: If given, the body is fed to it chunk by chunk as
+                it arrives instead of being buffered; b'' is returned on success
+            
+        Returns:
+            Tuple of (page body or None, diagnostics dictionary)
+        """
+        diagnostics = {}
+        try:
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                allow_redirects=True
+            ) as response:
+                final_url = str(response.url)
+                
+                diagnostics = {
+                    'status_code': response.status,
+                    'content_type': response.headers.get('Content-Type', 'unknown'),
+                    'charset': response.charset,
+                    'final_url': final_url,
+                    'redirected': final_url != url
+                }
+                
+                status_error = self._status_error(response.status)
+                if status_error:
+                    diagnostics['error'] = status_error
+                    return None, diagnostics
+                
+                response.raise_for_status()
+                
+                if stream_parser is None:
+                    body = await response.read()
+                    diagnostics['content_length'] = len(body)
+                    return body, diagnostics
+                
+                stream_parser.page_url = final_url
+                stream_parser.encoding = response.charset
+                async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                    stream_parser.feed(chunk)
+                return b'', diagnostics
+        
+        except asyncio.TimeoutError:
+            diagnostics['error'] = f"Request timed out after {self.timeout} seconds."
+        except aiohttp.TooManyRedirects:
+            diagnostics['error'] = "Too many redirects. The URL may be redirecting in a loop."
+        except aiohttp.ClientConnectionError:
+            diagnostics['error'] = "Connection error. Check your internet connection or the URL."
+        except aiohttp.ClientError as e:
+            diagnostics['error'] = f"Request failed: {str(e)}"
+        except Exception as e:
+            diagnostics['error'] = f"Unexpected error: {str(e)}"
+        return None, diagnostics
+    
+    async def extract_links_async(self, url: Optional[str] = None,
+                                  filter_domain: bool = True,
+                                  include_external: bool = True,
+                                  session: Optional['aiohttp.ClientSession'] = None
+                                  ) -> Tuple[Set[str], Dict]:
+        """
+        Asynchronous counterpart of extract_links() built on aiohttp.
+        
+        Args:
+            url: URL to extract links from (defaults to base_url)
+            filter_domain: If True, only include links from the same domain
+            include_external: If True, include external links
+            session: Optional aiohttp session to reuse across calls
+            
+        Returns:
+            Tuple of (Set of unique URLs, diagnostics dictionary)
+        """
+        if aiohttp is None:
+            return set(), {
+                'error': 'aiohttp not installed. Install with: pip install aiohttp',
+                'suggestion': 'Use extract_links() for synchronous extraction'
+            }
+        
+        target_url = url or self.base_url
+        if session is None:
+            async with self.new_client_session() as own_session:
+                return await self.extract_links_async(
+                    target_url, filter_domain, include_external, own_session
+                )
+        
+        if etree is None:
+            body, diagnostics = await self.fetch_page_async(session, target_url)
+            if body is None:
+                return set(), diagnostics
+            links = self._parse_links(
+                body, diagnostics['final_url'], filter_domain, include_external,
+                diagnostics, diagnostics['charset']
+            )
+            return links, diagnostics
+        
+        # Parse while the body is still downloading instead of buffering it
+        stream_parser = _StreamingLinkParser(
+            self, target_url, filter_domain, include_external
+        )
+        body, diagnostics = await self.fetch_page_async(session, target_url, stream_parser)
+        if body is None:
+            return set(), diagnostics
+        
+        try:
+            links = stream_parser.close()
+        except Exception as e:
+            diagnostics['error'] = f'Failed to parse HTML: {str(e)}'
+            return set(), diagnostics
+        stream_parser.record(diagnostics)
+        return links, diagnostics
+    
+    async def extract_links_batch(self, urls: Iterable[str],
+                                  filter_domain: bool = True,
+                                  include_external: bool = True,
+                                  max_concurrency: int = 10,
+                                  parse_in_processes: Optional[bool] = None,
+                                  on_done: Optional[Callable[[str, Set[str], Dict], None]] = None,
+                                  session: Optional['aiohttp.ClientSession'] = None
+                                  ) -> Dict[str, Tuple[Set[str], Dict]]:
+        """
+        Extract links from many URLs concurrently.
+        
+        All requests share one aiohttp session; at most ``max_concurrency``
+        of them are in flight at any time. Downloaded pages are parsed on a
+        process pool, so parsing one page overlaps with downloading the next
+        and scales across CPU cores. Each page is filtered against its own
+        domain, so a batch may mix hosts.
+        
+        Args:
+            urls: URLs to extract links from
+            filter_domain: If True, only include links from each page's domain
+            include_external: If True, include external links
+            max_concurrency: Maximum number of simultaneous requests
+            parse_in_processes: Parse on the process pool; defaults to True
+                when more than one CPU is available, otherwise pages are
+                parsed on the event loop as they stream in
+            on_done: Called as on_done(url, links, diagnostics) on the event
+                loop as each URL finishes, e.g. to report progress
+            session: Existing aiohttp session to reuse; it is left open.
+                When omitted one is opened for this batch only
+            
+        Returns:
+            Dictionary mapping each URL to its (links, diagnostics) tuple
+        """
+        urls = list(dict.fromkeys(urls))
+        if aiohttp is None:
+            error = {'error': 'aiohttp not installed. Install with: pip install aiohttp'}
+            results = {u: (set(), dict(error)) for u in urls}
+            if on_done is not None:
+                for u, (links, diagnostics) in results.items():
+                    on_done(u, links, diagnostics)
+            return results
+        
+        if session is None:
+            async with self.new_client_session(limit=max_concurrency) as own_session:
+                return await self.extract_links_batch(
+                    urls, filter_domain, include_external, max_concurrency,
+                    parse_in_processes, on_done, own_session
+                )
+        
+        if parse_in_processes is None:
+            parse_in_processes = (os.cpu_count() or 1) > 1
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+        
+        async def extract_one(u: str) -> Tuple[Set[str], Dict]:
+            # Domain filtering is relative to the page's own host
+            page_extractor = self
+            if urlparse(u).netloc != self._base_netloc:
+                page_extractor = LinkExtractor(u, timeout=self.timeout)
+            
+            if not parse_in_processes:
+                async with semaphore:
+                    return await page_extractor.extract_links_async(
+                        u, filter_domain, include_external, session
+                    )
+            
+            # Only the download holds a slot; parsing runs alongside the
+            # next downloads
+            async with semaphore:
+                body, diagnostics = await self.fetch_page_async(session, u)
+            if body is None:
+                return set(), diagnostics
+            
+            page_url = diagnostics['final_url']
+            pool = _get_parse_pool()
+            try:
+                links, parsed = await loop.run_in_executor(
+                    pool, _parse_and_extract, body, page_url,
+                    page_extractor.base_url, filter_domain, include_external,
+                    diagnostics['charset']
+                )
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    # A worker died; later batches get a fresh pool
+                    _discard_parse_pool(pool)
+                # The pool is unavailable for this page; parse here
+                parsed = {}
+                links = page_extractor._parse_links(
+                    body, page_url, filter_domain, include_external, parsed,
+                    diagnostics['charset']
+                )
+            
+            # Keep the transfer size rather than the parser's byte count
+            parsed.pop('content_length', None)
+            diagnostics.update(parsed)
+            return links, diagnostics
+        
+        async def bounded(u: str) -> Tuple[Set[str], Dict]:
+            try:
+                links, diagnostics = await extract_one(u)
+            except Exception as e:
+                links, diagnostics = set(), {'error': f"Unexpected error: {str(e)}"}
+            if on_done is not None:
+                on_done(u, links, diagnostics)
+            return links, diagnostics
+        
+        results = await asyncio.gather(*[bounded(u) for u in urls])
+        
+        return dict(zip(urls, results))
+    
     def extract_links(self, url: Optional[str] = None, 
                      filter_domain: bool = True,
                      include_external: bool = True) -> Tuple[Set[str], Dict]:
@@ -112,138 +916,283 @@ class LinkExtractor:
             Tuple of (Set of unique URLs, diagnostics dictionary)
         """
         target_url = url or self.base_url
-        response, error = self.fetch_page(target_url)
+        stream = etree is not None
+        response, error = self.fetch_page(target_url, stream=stream)
         
         if not response:
             return set(), {'error': error, **self.diagnostics}
         
-        # Try different parsers for better compatibility
-        parsers = ['html.parser', 'lxml', 'html5lib']
-        soup = None
+        if not stream:
+            links = self._parse_links(
+                response.content, response.url, filter_domain, include_external, self.diagnostics
+            )
+            return links, self.diagnostics
         
-        for parser in parsers:
-            try:
-                soup = BeautifulSoup(response.content, parser)
-                break
-            except Exception:
-                continue
+        # Only trust an explicit charset; requests otherwise guesses ISO-8859-1
+        content_type = response.headers.get('Content-Type', '')
+        encoding = response.encoding if 'charset' in content_type.lower() else None
+        with response:
+            links = self._parse_links_stream(
+                response.iter_content(_STREAM_CHUNK_SIZE), response.url,
+                filter_domain, include_external, self.diagnostics, encoding
+            )
+        return links, self.diagnostics
+    
+    def parse_links(self, html, page_url: Optional[str] = None,
+                    filter_domain: bool = True,
+                    include_external: bool = True,
+                    encoding: Optional[str] = None) -> Tuple[Set[str], Dict]:
+        """
+        Extract links from HTML that has already been downloaded.
         
-        if not soup:
-            return set(), {'error': 'Failed to parse HTML with any parser', **self.diagnostics}
+        Args:
+            html: Page markup (bytes or str)
+            page_url: URL the page was served from (defaults to base_url)
+            filter_domain: If True, only include links from the same domain
+            include_external: If True, include external links
+            encoding: Charset declared by the server, if any (e.g. the
+                'charset' entry of fetch_page_async() diagnostics)
+            
+        Returns:
+            Tuple of (Set of unique URLs, diagnostics dictionary)
+        """
+        diagnostics = {}
+        links = self._parse_links(
+            html, page_url or self.base_url, filter_domain, include_external,
+            diagnostics, encoding
+        )
+        return links, diagnostics
+    
+    def _parse_links(self, content, page_url: str,
+                     filter_domain: bool, include_external: bool,
+                     diagnostics: Dict,
+                     encoding: Optional[str] = None) -> Set[str]:
+        """
+        Extract links from raw page content.
         
-        links = set()
+        Args:
+            content: Raw HTML of the page (bytes or already-decoded str)
+            page_url: Final URL of the page, used to resolve relative links
+            filter_domain: If True, only include links from the same domain
+            include_external: If True, include external links
+            diagnostics: Dictionary updated with parsing statistics
+            encoding: Charset declared by the server, if any
+            
+        Returns:
+            Set of unique URLs
+        """
+        if etree is not None:
+            return self._parse_links_stream(
+                (content,), page_url, filter_domain, include_external, diagnostics, encoding
+            )
+        return self._parse_links_soup(
+            content, page_url, filter_domain, include_external, diagnostics, encoding
+        )
+    
+    def _parse_links_stream(self, chunks: Iterable, page_url: str,
+                            filter_domain: bool, include_external: bool,
+                            diagnostics: Dict,
+                            encoding: Optional[str] = None) -> Set[str]:
+        """
+        Extract links with lxml's event-driven pull parser.
         
-        # Extract all anchor tags with href attributes
-        anchors = soup.find_all('a', href=True)
-        self.diagnostics['anchor_tags_found'] = len(anchors)
+        Chunks are parsed as they arrive and every element is released once
+        it has been inspected, so memory use is bounded by the chunk size
+        rather than by the size of the page.
         
-        for anchor in anchors:
-            href = anchor.get('href', '').strip()
+        Args:
+            chunks: Iterable of bytes (or str) fragments of the page
+            page_url: Final URL of the page, used to resolve relative links
+            filter_domain: If True, only include links from the same domain
+            include_external: If True, include external links
+            diagnostics: Dictionary updated with parsing statistics
+            encoding: Charset declared by the server, if any
             
-            # Skip empty, javascript:, mailto:, tel:, and fragment-only links
-            if not href or href.startswith('javascript:') or href.startswith('mailto:') or \
-               href.startswith('tel:') or href.startswith('#') or href.startswith('data:'):
+        Returns:
+            Set of unique URLs
+        """
+        stream_parser = _StreamingLinkParser(
+            self, page_url, filter_domain, include_external, encoding
+        )
+        try:
+            for chunk in chunks:
+                stream_parser.feed(chunk)
+            links = stream_parser.close()
+        except Exception as e:
+            diagnostics['error'] = f'Failed to parse HTML: {str(e)}'
+            return set()
+        
+        stream_parser.record(diagnostics)
+        return links
+    
+    def _links_from_events(self, parser, page_url: str,
+                           filter_domain: bool, include_external: bool,
+                           links: Set[str]) -> int:
+        """
+        Collect links from the elements the pull parser has finished.
+        
+        Returns:
+            Number of anchor tags with an href seen
+        """
+        anchors_found = 0
+        
+        for _, element in parser.read_events():
+            tag = element.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions
                 continue
             
-            # Convert relative URLs to absolute URLs
-            try:
-                absolute_url = urljoin(response.url, href)
-                # Clean and validate the URL
-                cleaned_url = self._clean_url(absolute_url)
-                
-                if not cleaned_url:
-                    continue
-                
-                # Filter based on domain if requested
-                if filter_domain and not include_external:
-                    if self._is_same_domain(cleaned_url):
-                        links.add(cleaned_url)
-                else:
-                    links.add(cleaned_url)
-            except Exception:
-                # Skip invalid URLs
-                continue
+            if self._links_from_element(tag, element, element.text, page_url,
+                                        filter_domain, include_external, links):
+                anchors_found += 1
+            
+            # Release the finished subtree so memory stays bounded. The root
+            # has no parent, though it may have top-level siblings (comments,
+            # an XML declaration) that cannot be deleted this way.
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
         
-        # Also try to extract links from other sources
-        # Look for links in data attributes, onclick handlers, etc.
-        additional_links = self._extract_links_from_scripts(soup, response.url)
-        links.update(additional_links)
+        return anchors_found
+    
+    def _links_from_element(self, tag: str, element, text: Optional[str],
+                            page_url: str, filter_domain: bool,
+                            include_external: bool, links: Set[str]) -> bool:
+        """
+        Collect the links carried by a single element.
         
-        # Look for links in other HTML elements
-        for element in soup.find_all(['link', 'area'], href=True):
-            href = element.get('href', '').strip()
-            if href and not href.startswith('javascript:'):
-                try:
-                    absolute_url = urljoin(response.url, href)
-                    cleaned_url = self._clean_url(absolute_url)
-                    if cleaned_url:
-                        links.add(cleaned_url)
-                except Exception:
-                    continue
+        Shared by the lxml and BeautifulSoup walkers; both element types
+        expose attributes through get().
         
-        # Look for router links (common in SPAs)
-        for element in soup.find_all(attrs={'routerlink': True}):
-            href = element.get('routerlink', '').strip()
-            if href:
-                try:
-                    absolute_url = urljoin(response.url, href)
-                    cleaned_url = self._clean_url(absolute_url)
-                    if cleaned_url:
-                        links.add(cleaned_url)
-                except Exception:
-                    continue
+        Args:
+            tag: Lower-case tag name
+            element: lxml or BeautifulSoup element
+            text: Text content of the element (only used for scripts)
+            page_url: Final URL of the page, used to resolve relative links
+            filter_domain: If True, only include links from the same domain
+            include_external: If True, include external links
+            links: Set the links are added to
+            
+        Returns:
+            True if the element is an anchor with an href
+        """
+        is_anchor = False
         
-        # Look for links in JSON-LD structured data
-        for script in soup.find_all('script', type='application/ld+json'):
-            if script.string:
-                try:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        for key, value in data.items():
-                            if isinstance(value, str) and value.startswith('http'):
-                                links.add(value.split('#')[0])
-                            elif isinstance(value, list):
-                                for item in value:
-                                    if isinstance(item, str) and item.startswith('http'):
-                                        links.add(item.split('#')[0])
-                except:
-                    pass
-        
-        self.diagnostics['unique_links_found'] = len(links)
-        self.diagnostics['success'] = True
+        if tag == 'a':
+            href = element.get('href')
+            if href is not None:
+                is_anchor = True
+                # Filter based on domain if requested
+                cleaned_url = _normalize_href(
+                    href, page_url, self._base_netloc, include_external or not filter_domain
+                )
+                if cleaned_url:
+                    links.add(cleaned_url)
+        elif tag == 'link' or tag == 'area':
+            href = (element.get('href') or '').strip()
+            if href and not href.startswith('javascript:'):
+                self._add_joined(links, page_url, href)
+        elif tag == 'script' and text:
+            # Look for links in JSON-LD structured data
+            if element.get('type') == 'application/ld+json':
+                links.update(self._extract_links_from_json_ld(text))
+            # Find URLs in JavaScript code
+            links.update(filter(None, map(_clean_url, _URL_RE.findall(text))))
         
-        return links, self.diagnostics
+        # Router links (common in SPAs) and data attributes can sit on any tag
+        router_link = (element.get('routerlink') or '').strip()
+        if router_link:
+            self._add_joined(links, page_url, router_link)
+        data_href = (element.get('data-href') or '').strip()
+        if data_href and not data_href.startswith('javascript:'):
+            self._add_joined(links, page_url, data_href)
+        
+        return is_anchor
     
-    def _extract_links_from_scripts(self, soup: BeautifulSoup, base_url: str) -> Set[str]:
-        """Extract URLs from JavaScript code and data attributes."""
+    @staticmethod
+    def _add_joined(links: Set[str], page_url: str, href: str) -> None:
+        """Resolve href against the page URL and add it if it is valid."""
+        try:
+            absolute_url = urljoin(page_url, href)
+        except ValueError:
+            return  # e.g. a malformed IPv6 host
+        # _clean_url() already returns None instead of raising
+        cleaned_url = _clean_url(absolute_url)
+        if cleaned_url:
+            links.add(cleaned_url)
+    
+    def _parse_links_soup(self, content, page_url: str,
+                          filter_domain: bool, include_external: bool,
+                          diagnostics: Dict,
+                          encoding: Optional[str] = None) -> Set[str]:
+        """
+        Extract links with BeautifulSoup when lxml is not available.
+        
+        Args:
+            content: Raw HTML of the page (bytes or already-decoded str)
+            page_url: Final URL of the page, used to resolve relative links
+            filter_domain: If True, only include links from the same domain
+            include_external: If True, include external links
+            diagnostics: Dictionary updated with parsing statistics
+            encoding: Charset declared by the server, if any
+            
+        Returns:
+            Set of unique URLs
+        """
+        try:
+            soup = self._parse_soup(content, encoding)
+        except Exception as e:
+            diagnostics['error'] = f'Failed to parse HTML: {str(e)}'
+            return set()
+        
         links = set()
+        anchors_found = 0
         
-        # Look for URLs in script tags
-        for script in soup.find_all('script'):
-            if script.string:
-                # Find URLs in JavaScript code
-                url_pattern = r'https?://[^\s"\'<>]+'
-                found_urls = re.findall(url_pattern, script.string)
-                for url in found_urls:
-                    try:
-                        cleaned_url = self._clean_url(url)
-                        if cleaned_url:
-                            links.add(cleaned_url)
-                    except Exception:
-                        continue
+        # One walk over the (strained) tree instead of a find_all() per source
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            name = element.name
+            text = element.string if name == 'script' else None
+            if self._links_from_element(name, element, text, page_url,
+                                        filter_domain, include_external, links):
+                anchors_found += 1
         
-        # Look for links in data attributes
-        for element in soup.find_all(attrs={'data-href': True}):
-            href = element.get('data-href', '').strip()
-            if href and not href.startswith('javascript:'):
-                try:
-                    absolute_url = urljoin(base_url, href)
-                    cleaned_url = self._clean_url(absolute_url)
-                    if cleaned_url:
-                        links.add(cleaned_url)
-                except Exception:
-                    continue
+        diagnostics['anchor_tags_found'] = anchors_found
+        diagnostics['unique_links_found'] = len(links)
+        diagnostics['success'] = True
+        
+        return links
+    
+    @staticmethod
+    def _parse_soup(content, encoding: Optional[str] = None) -> BeautifulSoup:
+        """
+        Parse a page once so every extractor can share the same tree.
+        
+        Args:
+            content: Raw page bytes (preferred, so the parser can detect the
+                encoding itself) or already-decoded HTML
+            encoding: Charset declared by the server, tried first for bytes
+            
+        Returns:
+            BeautifulSoup tree restricted to link-bearing tags
+        """
+        if encoding and isinstance(content, bytes):
+            return BeautifulSoup(content, PARSER, parse_only=STRAINER, from_encoding=encoding)
+        return BeautifulSoup(content, PARSER, parse_only=STRAINER)
+    
+    @staticmethod
+    def _extract_links_from_json_ld(text: str) -> Set[str]:
+        """Extract URLs from the URL-bearing properties of a JSON-LD document."""
+        links = set()
+        try:
+            data = _json_loads(text)
+        except ValueError:
+            return links
         
+        _collect_json_ld_urls(data, links)
         return links
     
     def extract_links_with_browser(self, url: Optional[str] = None, 
@@ -263,13 +1212,11 @@ class LinkExtractor:
             Tuple of (Set of unique URLs, diagnostics dictionary)
         """
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.service import Service
-            from selenium.webdriver.chrome.options import Options
+            import selenium  # noqa: F401
+            import webdriver_manager  # noqa: F401
             from selenium.webdriver.common.by import By
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
-            from webdriver_manager.chrome import ChromeDriverManager
         except ImportError:
             return set(), {
                 'error': 'Selenium not installed. Install with: pip install selenium webdriver-manager',
@@ -277,76 +1224,17 @@ class LinkExtractor:
             }
         
         target_url = url or self.base_url
-        links = set()
-        
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')  # Run in background
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument(f'user-agent={self.session.headers["User-Agent"]}')
+        self.diagnostics = {}
         
         driver = None
         try:
-            # Initialize Chrome driver with better error handling
-            # Set Chrome binary location for macOS
-            if platform.system().lower() == 'darwin':
-                chrome_binary = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-                import os
-                if os.path.exists(chrome_binary):
-                    chrome_options.binary_location = chrome_binary
-            
-            # Try to use system ChromeDriver first (faster and more reliable)
-            import os
-            import shutil
-            driver_found = False
-            
-            # Check common ChromeDriver locations
-            common_paths = [
-                '/opt/homebrew/bin/chromedriver',  # Homebrew on Apple Silicon
-                '/usr/local/bin/chromedriver',      # Homebrew on Intel Mac
-                shutil.which('chromedriver'),       # System PATH
-            ]
-            
-            # Remove None values
-            common_paths = [p for p in common_paths if p and os.path.exists(p)]
-            
-            # Try system ChromeDriver first
-            for path in common_paths:
-                try:
-                    service = Service(path)
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
-                    driver_found = True
-                    self.diagnostics['chromedriver_source'] = 'system'
-                    break
-                except Exception:
-                    continue
-            
-            # If system ChromeDriver doesn't work, try ChromeDriverManager
-            if not driver_found:
-                try:
-                    driver_path = ChromeDriverManager().install()
-                    service = Service(driver_path)
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
-                    driver_found = True
-                    self.diagnostics['chromedriver_source'] = 'webdriver-manager'
-                except Exception as e1:
-                    # Last resort: try without specifying service
-                    try:
-                        driver = webdriver.Chrome(options=chrome_options)
-                        driver_found = True
-                        self.diagnostics['chromedriver_source'] = 'auto-detect'
-                    except Exception as e2:
-                        error_msg = f"ChromeDriver setup failed. Tried system paths and webdriver-manager. "
-                        error_msg += f"Errors: {str(e1)} / {str(e2)}. "
-                        error_msg += "If ChromeDriver is installed, ensure it's in PATH or try: brew install chromedriver"
-                        raise Exception(error_msg)
+            # Reuse a warm browser when one is pooled; launching Chrome is slow
+            driver, source = _get_driver()
+            self.diagnostics['chromedriver_source'] = source
             
             # Navigate to page with aggressive timeout handling
-            # Use a very long timeout for browser automation (60 seconds)
-            browser_timeout = max(timeout * 3, 60)
+            # Use a very long timeout for browser automation (at least 60 seconds)
+            browser_timeout = max(self.timeout * 3, 60)
             driver.set_page_load_timeout(browser_timeout)
             
             page_loaded = False
@@ -379,22 +1267,26 @@ class LinkExtractor:
                     self.diagnostics['body_wait_warning'] = 'Body element wait timeout, but continuing'
                 
                 # Additional wait for dynamic content
-                # Use progressive waiting - check every second if content has stabilized
-                initial_links = 0
-                stable_count = 0
-                for i in range(wait_time):
-                    time.sleep(1)
+                # Poll readyState and the anchor count in one script call and stop
+                # as soon as the page is loaded and the links have settled
+                settle = {'count': -1, 'since': 0.0}
+                
+                def content_settled(d) -> bool:
                     try:
-                        current_links = len(driver.find_elements(By.TAG_NAME, "a"))
-                        if current_links == initial_links:
-                            stable_count += 1
-                            if stable_count >= 3:  # Content stable for 3 seconds
-                                break
-                        else:
-                            initial_links = current_links
-                            stable_count = 0
+                        state, count = d.execute_script(_SETTLE_SCRIPT)
                     except Exception:
-                        pass
+                        return False
+                    now = time.monotonic()
+                    if state != 'complete' or count != settle['count']:
+                        settle['count'] = count
+                        settle['since'] = now
+                        return False
+                    return now - settle['since'] >= _SETTLE_SECONDS
+                
+                try:
+                    WebDriverWait(driver, wait_time, poll_frequency=0.25).until(content_settled)
+                except Exception:
+                    pass  # Work with whatever has rendered after wait_time
             
             # Get page source after JavaScript execution
             try:
@@ -406,41 +1298,15 @@ class LinkExtractor:
             if not html or len(html) < 100:
                 raise Exception("Page source is empty or too small - page may not have loaded")
             
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Extract links
-            anchors = soup.find_all('a', href=True)
-            self.diagnostics['anchor_tags_found'] = len(anchors)
             self.diagnostics['page_title'] = driver.title
             
-            for anchor in anchors:
-                href = anchor.get('href', '').strip()
-                
-                if not href or href.startswith('javascript:') or href.startswith('mailto:') or \
-                   href.startswith('tel:') or href.startswith('#') or href.startswith('data:'):
-                    continue
-                
-                try:
-                    absolute_url = urljoin(target_url, href)
-                    cleaned_url = self._clean_url(absolute_url)
-                    
-                    if not cleaned_url:
-                        continue
-                    
-                    if filter_domain and not include_external:
-                        if self._is_same_domain(cleaned_url):
-                            links.add(cleaned_url)
-                    else:
-                        links.add(cleaned_url)
-                except Exception:
-                    continue
-            
-            # Also extract from JavaScript and other sources
-            additional_links = self._extract_links_from_scripts(soup, target_url)
-            links.update(additional_links)
+            # Extract links from the rendered markup
+            links = self._parse_links(
+                html, target_url, filter_domain, include_external, self.diagnostics
+            )
+            if self.diagnostics.get('error'):
+                raise Exception(self.diagnostics.pop('error'))
             
-            self.diagnostics['unique_links_found'] = len(links)
-            self.diagnostics['success'] = True
             self.diagnostics['method'] = 'browser_automation'
             
             return links, self.diagnostics
@@ -465,98 +1331,20 @@ class LinkExtractor:
             return set(), self.diagnostics
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except Exception:
-                    pass  # Ignore errors when closing driver
+                _release_driver(driver)
     
     def _is_valid_url(self, url: str) -> bool:
-        """
-        Validate if a URL is properly formatted and not malformed.
-        
-        Args:
-            url: URL to validate
-            
-        Returns:
-            True if URL is valid, False otherwise
-        """
-        try:
-            parsed = urlparse(url)
-            
-            # Must have scheme and netloc
-            if not parsed.scheme or not parsed.netloc:
-                return False
-            
-            # Scheme must be http or https
-            if parsed.scheme not in ['http', 'https']:
-                return False
-            
-            # Check for malformed patterns
-            # URLs with HTML entities encoded (like %22%3E, %3C/a%3E)
-            if '%22%3E' in url or '%3C' in url or '%3E' in url:
-                # But allow normal URL encoding like %20 for spaces
-                # Only reject if it looks like HTML entities
-                if '%22%3E' in url or '%3C/a' in url or 'href%3D' in url.lower():
-                    return False
-            
-            # Check for multiple URLs concatenated (contains http:// or https:// more than once)
-            if url.count('http://') > 1 or url.count('https://') > 1:
-                return False
-            
-            # Check for URLs that are too long (likely malformed)
-            if len(url) > 2000:
-                return False
-            
-            # Check for invalid characters in domain
-            if any(char in parsed.netloc for char in ['<', '>', '"', "'"]):
-                return False
-            
-            # Check if URL can be parsed properly
-            # Try to reconstruct it - if it's malformed, this will fail
-            reconstructed = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            if parsed.query:
-                reconstructed += f"?{parsed.query}"
-            if parsed.fragment:
-                reconstructed += f"#{parsed.fragment}"
-            
-            # Basic sanity check - URL should be reasonable
-            return True
-            
-        except Exception:
-            return False
+        """Validate if a URL is properly formatted and not malformed."""
+        return _is_valid_url(url)
     
     def _clean_url(self, url: str) -> Optional[str]:
-        """
-        Clean and normalize a URL.
-        
-        Args:
-            url: URL to clean
-            
-        Returns:
-            Cleaned URL or None if invalid
-        """
-        try:
-            # Remove fragments
-            url = url.split('#')[0]
-            
-            # Remove trailing slashes (except for root)
-            if url.endswith('/') and urlparse(url).path != '/':
-                url = url.rstrip('/')
-            
-            # Validate the URL
-            if not self._is_valid_url(url):
-                return None
-            
-            return url
-        except Exception:
-            return None
+        """Clean and normalize a URL, returning None if it is invalid."""
+        return _clean_url(url)
     
     def _is_same_domain(self, url: str) -> bool:
         """Check if URL belongs to the same domain as base_url."""
         try:
-            base_domain = urlparse(self.base_url).netloc
-            url_domain = urlparse(url).netloc
-            return base_domain == url_domain
+            return urlparse(url).netloc == self._base_netloc
         except Exception:
             return False
     
@@ -577,6 +1365,96 @@ class LinkExtractor:
             include_external=include_external
         )
         return sorted(list(links)), diagnostics
+    
+    def crawl(self, seeds: Optional[Iterable[str]] = None,
+              depth: int = 1,
+              max_workers: int = 20,
+              max_pages: int = 200,
+              per_host_limit: int = 4,
+              filter_domain: bool = False,
+              include_external: bool = True) -> Tuple[Set[str], Dict]:
+        """
+        Extract links from the seed pages and follow same-domain links.
+        
+        Pages are fetched in parallel on a thread pool (requests releases
+        the GIL while waiting on sockets), one breadth-first level at a
+        time. Concurrent requests to any single host are capped so the
+        crawl does not hammer one server.
+        
+        Args:
+            seeds: Start URLs (defaults to [base_url])
+            depth: Number of link hops to follow beyond the seed pages
+            max_workers: Size of the thread pool
+            max_pages: Maximum number of pages to fetch in total
+            per_host_limit: Maximum simultaneous requests per host
+            filter_domain: If True, only include links from the same domain
+            include_external: If True, include external links
+            
+        Returns:
+            Tuple of (Set of unique URLs found on all pages, diagnostics dictionary)
+        """
+        seeds = list(dict.fromkeys(seeds or [self.base_url]))[:max_pages]
+        seen = set(seeds)
+        frontier = seeds
+        all_links = set()
+        errors = {}
+        pages_crawled = 0
+        
+        host_limits = defaultdict(lambda: threading.Semaphore(per_host_limit))
+        host_limits_lock = threading.Lock()
+        
+        def extract(page_url: str) -> Tuple[Set[str], Dict]:
+            netloc = urlparse(page_url).netloc
+            with host_limits_lock:
+                host_limit = host_limits[netloc]
+            with host_limit:
+                # A fresh extractor per page keeps diagnostics thread-local;
+                # the HTTP session is shared
+                extractor = LinkExtractor(page_url, timeout=self.timeout)
+                return extractor.extract_links(
+                    page_url,
+                    filter_domain=filter_domain,
+                    include_external=include_external
+                )
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in range(depth + 1):
+                if not frontier:
+                    break
+                
+                futures = {executor.submit(extract, u): u for u in frontier}
+                found = set()
+                for future in as_completed(futures):
+                    page_url = futures[future]
+                    links, diagnostics = future.result()
+                    pages_crawled += 1
+                    if diagnostics.get('error'):
+                        errors[page_url] = diagnostics['error']
+                    found |= links
+                
+                new_links = found - all_links
+                all_links |= found
+                
+                # Queue unseen same-domain pages for the next level
+                frontier = []
+                if level < depth:
+                    for link in sorted(new_links):
+                        if len(seen) >= max_pages:
+                            break
+                        if link in seen or not self._is_same_domain(link) or \
+                           urlparse(link).path.lower().endswith(_NON_PAGE_EXTENSIONS):
+                            continue
+                        seen.add(link)
+                        frontier.append(link)
+        
+        diagnostics = {
+            'pages_crawled': pages_crawled,
+            'pages_failed': len(errors),
+            'errors': errors,
+            'unique_links_found': len(all_links),
+            'success': pages_crawled > len(errors)
+        }
+        return all_links, diagnostics
 
 
 def main():
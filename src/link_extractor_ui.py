@@ -4,18 +4,24 @@ A vibrant and modern interface for extracting links from websites.
 """
 
 import streamlit as st
-import sys
-import os
-
-# Add current directory to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
-
 from link_extractor import LinkExtractor
+from async_fetcher import fetch_many
+import asyncio
+import csv
+import io
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
 from urllib.parse import urlparse
 
 
+# Number of link cards rendered per results page
+LINKS_PER_PAGE = 100
+
 # Page configuration
 st.set_page_config(
     page_title="🔗 Link Extractor",
@@ -24,136 +30,327 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data(show_spinner=False)
+def _load_css() -> str:
+    """Read the app stylesheet once per process."""
+    return (Path(__file__).parent / 'assets' / 'style.css').read_text(encoding='utf-8')
+
+
 # Custom CSS for vibrant styling
-st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700&display=swap');
-    
-    .main {
-        font-family: 'Poppins', sans-serif;
-    }
-    
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        text-align: center;
-    }
-    
-    .main-header h1 {
-        color: white;
-        font-size: 3rem;
-        margin: 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .main-header p {
-        color: rgba(255,255,255,0.9);
-        font-size: 1.2rem;
-        margin-top: 0.5rem;
-    }
-    
-    .stButton>button {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        border: none;
-        border-radius: 25px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        font-size: 1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    
-    .stButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0,0,0,0.3);
-    }
-    
-    .link-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        transition: all 0.3s ease;
-        border-left: 4px solid #667eea;
-    }
-    
-    .link-card:hover {
-        transform: translateX(5px);
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    
-    .stats-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-    }
-    
-    .stats-number {
-        font-size: 2.5rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .stats-label {
-        color: #666;
-        font-size: 1rem;
-        margin-top: 0.5rem;
-    }
-    
-    .success-message {
-        background: linear-gradient(135deg, #84fab0 0%, #8fd3f4 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        font-weight: 600;
-        margin: 1rem 0;
-    }
-    
-    .error-message {
-        background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        font-weight: 600;
-        margin: 1rem 0;
-    }
-    
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    input[type="text"] {
-        border-radius: 10px !important;
-        border: 2px solid #667eea !important;
-    }
-    </style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=8192)
+def _parse(url: str):
+    """Memoized urlparse; the result tuple is immutable so sharing it is safe."""
+    return urlparse(url)
 
 
+def _host(url: str) -> str:
+    """Fast lower-cased netloc of an absolute URL, without building a SplitResult."""
+    return url.split("://", 1)[-1].split("/", 1)[0].split("?", 1)[0].split("#", 1)[0].lower()
+
+
+@lru_cache(maxsize=1024)
 def validate_url(url: str) -> bool:
     """Validate if the URL is properly formatted."""
     try:
-        result = urlparse(url)
+        result = _parse(url)
         return all([result.scheme, result.netloc])
     except Exception:
         return False
 
 
+class ExtractionFailed(Exception):
+    """Carries the diagnostics of a failed extraction out of cached_extract."""
+    
+    def __init__(self, diagnostics: Dict):
+        super().__init__(diagnostics.get('error'))
+        self.diagnostics = diagnostics
+
+
+@st.cache_resource
+def get_fetch_session() -> Tuple[asyncio.AbstractEventLoop, Any]:
+    """
+    Event loop thread and aiohttp session shared by every fetch.
+    
+    The session lives as long as the process, so repeat clicks reuse its
+    keep-alive connections and DNS cache instead of opening new ones.
+    
+    Returns:
+        Tuple of (running event loop, aiohttp.ClientSession bound to it)
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name='fetch-loop', daemon=True).start()
+    
+    async def open_session():
+        return LinkExtractor('http://localhost').new_client_session(limit=50)
+    
+    return loop, asyncio.run_coroutine_threadsafe(open_session(), loop).result()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_extract(url: str, timeout: int, filter_domain: bool,
+                   include_external: bool, use_browser: bool) -> Tuple[List[str], Dict]:
+    """
+    Extract links from a URL, memoized across reruns and sessions.
+    
+    Failures raise ExtractionFailed, which st.cache_data does not store,
+    so a timeout or a blocked request is retried on the next click.
+    
+    Returns:
+        Tuple of (sorted list of links, diagnostics dictionary)
+    """
+    extractor = LinkExtractor(url, timeout=timeout)
+    
+    if use_browser:
+        links, diagnostics = extractor.extract_links_with_browser(
+            filter_domain=filter_domain,
+            include_external=include_external,
+            wait_time=5
+        )
+        if diagnostics.get('error'):
+            raise ExtractionFailed(diagnostics)
+        return sorted(links), diagnostics
+    
+    loop, session = get_fetch_session()
+    (html, diagnostics), = asyncio.run_coroutine_threadsafe(
+        fetch_many([url], timeout, session=session), loop
+    ).result()
+    if html is None:
+        raise ExtractionFailed(diagnostics)
+    
+    links, parse_diagnostics = extractor.parse_links(
+        html,
+        diagnostics.get('final_url', url),
+        filter_domain=filter_domain,
+        include_external=include_external,
+        encoding=diagnostics.get('charset')
+    )
+    diagnostics.update(parse_diagnostics)
+    if diagnostics.get('error'):
+        raise ExtractionFailed(diagnostics)
+    return sorted(links), diagnostics
+
+
+def extract(url: str, timeout: int, filter_domain: bool,
+            include_external: bool, use_browser: bool) -> Tuple[List[str], Dict]:
+    """cached_extract() that reports failures as an empty result with diagnostics."""
+    try:
+        return cached_extract(url, timeout, filter_domain, include_external, use_browser)
+    except ExtractionFailed as e:
+        return [], e.diagnostics
+
+
+@st.cache_data(show_spinner=False)
+def _to_txt(links: Tuple[str, ...]) -> bytes:
+    """Build the TXT export once per result set."""
+    return "\n".join(links).encode()
+
+
+@st.cache_data(show_spinner=False)
+def _to_csv(links: Tuple[str, ...]) -> bytes:
+    """Build the CSV export once per result set."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['#', 'URL'])
+    writer.writerows(enumerate(links, 1))
+    return output.getvalue().encode()
+
+
+@st.cache_resource
+def get_browser_executor() -> ThreadPoolExecutor:
+    """Worker threads for browser extractions, one per pooled Chrome instance."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def _stat_card(number: int, label: str) -> str:
+    """HTML for one statistics card."""
+    return (
+        f'<div class="stats-card"><div class="stats-number">{number}</div>'
+        f'<div class="stats-label">{label}</div></div>'
+    )
+
+
+def render_extraction_result(url: str, links: List[str], diagnostics: Dict):
+    """Store a finished extraction in session state and report how it went."""
+    # Store diagnostics
+    st.session_state['diagnostics'] = diagnostics
+    
+    if links:
+        st.session_state['extracted_links'] = links
+        st.session_state['source_url'] = url
+        st.session_state['links_lower'] = [link.lower() for link in links]
+        st.session_state.pop('netlocs', None)
+    
+        st.markdown(f"""
+            <div class="success-message">
+                ✅ Successfully extracted {len(links)} unique links!
+            </div>
+        """, unsafe_allow_html=True)
+    
+        # Show diagnostics in expander
+        with st.expander("📊 Request Diagnostics"):
+            st.json(diagnostics)
+    else:
+        # Show detailed error information
+        error_msg = diagnostics.get('error', 'Unknown error')
+        anchor_count = diagnostics.get('anchor_tags_found', 0)
+        content_length = diagnostics.get('content_length', 0)
+        status_code = diagnostics.get('status_code', 'N/A')
+    
+        error_html = f"""
+            <div class="error-message">
+                ⚠️ No links found on this page.
+                <br><br>
+                <strong>Details:</strong><br>
+                • Status Code: {status_code}<br>
+                • Content Length: {content_length:,} bytes<br>
+                • Anchor Tags Found: {anchor_count}<br>
+                • Error: {error_msg if error_msg else 'None'}
+            </div>
+        """
+    
+        st.markdown(error_html, unsafe_allow_html=True)
+    
+        # Provide helpful suggestions
+        st.info("""
+        **Possible reasons why no links were found:**
+        - The page content is loaded dynamically with JavaScript (requires browser automation)
+        - The website is blocking automated requests
+        - The page requires authentication
+        - The page structure doesn't use standard `<a>` tags
+        - The page returned an error or empty content
+    
+        **Try:**
+        - Increasing the timeout in settings
+        - Checking if the URL is accessible in a browser
+        - Trying a different page from the same website
+        """)
+    
+        # Show diagnostics
+        with st.expander("📊 Request Diagnostics"):
+            st.json(diagnostics)
+
+
+def render_extraction_error(e: Exception):
+    """Report an extraction that raised."""
+    st.markdown(f"""
+        <div class="error-message">
+            ❌ Error: {str(e)}
+        </div>
+    """, unsafe_allow_html=True)
+    
+    st.error(f"Full error details: {type(e).__name__}: {str(e)}")
+
+
+@st.fragment(run_every=1)
+def browser_job_status():
+    """Poll the background browser extraction until it finishes."""
+    job = st.session_state.get('browser_job')
+    if job is None:
+        return
+    
+    url, future = job
+    if not future.done():
+        st.info(f"🌐 Rendering {url} in a headless browser... The rest of the app stays usable meanwhile.")
+        return
+    
+    # Hand the finished job to a full rerun so the results section renders
+    st.session_state['browser_result'] = st.session_state.pop('browser_job')
+    st.rerun()
+
+
+def batch_section(timeout: int, filter_domain: bool, include_external: bool):
+    """Extract links from a list of URLs concurrently."""
+    with st.expander("📚 Batch Extraction", expanded='batch_results' in st.session_state):
+        urls_text = st.text_area("URLs, one per line", placeholder="https://example.com\nhttps://example.org")
+        
+        if st.button("🚀 Batch Extract"):
+            lines = list(dict.fromkeys(line.strip() for line in urls_text.splitlines() if line.strip()))
+            urls = [line for line in lines if validate_url(line)]
+            if len(urls) < len(lines):
+                st.warning(f"Skipped {len(lines) - len(urls)} invalid URL(s)")
+            
+            if urls:
+                progress = st.progress(0.0, text=f"0 / {len(urls)} pages")
+                finished = []
+                
+                def on_done(url, links, diagnostics):
+                    finished.append(url)
+                    progress.progress(
+                        len(finished) / len(urls), text=f"{len(finished)} / {len(urls)} pages"
+                    )
+                
+                results = asyncio.run(LinkExtractor(urls[0], timeout=timeout).extract_links_batch(
+                    urls, filter_domain=filter_domain,
+                    include_external=include_external, on_done=on_done
+                ))
+                st.session_state['batch_results'] = [
+                    (url, (sorted(links), diagnostics))
+                    for url, (links, diagnostics) in results.items()
+                ]
+        
+        batch_results = st.session_state.get('batch_results')
+        if batch_results:
+            st.dataframe(
+                [
+                    {
+                        'URL': url,
+                        'Links': len(links),
+                        'Status': str(diagnostics.get('status_code', 'N/A')),
+                        'Error': diagnostics.get('error', ''),
+                    }
+                    for url, (links, diagnostics) in batch_results
+                ],
+                use_container_width=True
+            )
+            all_links = sorted({link for _, (links, _) in batch_results for link in links})
+            st.download_button(
+                label=f"📥 Download all {len(all_links)} links as TXT",
+                data=_to_txt(tuple(all_links)),
+                file_name="links_batch.txt",
+                mime="text/plain"
+            )
+
+
+@st.fragment
+def render_links():
+    """Filter, paginate and render the extracted links without rerunning the page."""
+    links = st.session_state['extracted_links']
+    netlocs = st.session_state['netlocs']
+    source_netloc = st.session_state['source_netloc']
+    
+    # Search/filter functionality
+    search_term = st.text_input("🔍 Filter links", placeholder="Search in URLs...")
+    
+    filtered_links = list(zip(links, netlocs))
+    if search_term:
+        needle = search_term.lower()
+        filtered_links = [
+            pair for pair, lowered in zip(filtered_links, st.session_state['links_lower'])
+            if needle in lowered
+        ]
+        st.info(f"Showing {len(filtered_links)} of {len(links)} links")
+    
+    # Render one page of links as a single markdown block
+    page_count = max(1, -(-len(filtered_links) // LINKS_PER_PAGE))
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    offset = (page - 1) * LINKS_PER_PAGE
+    
+    links_html = "\n".join(
+        f'<div class="link-card"><strong>#{i}</strong> '
+        f'{"🏠 Internal" if netloc == source_netloc else "🌐 External"}<br>'
+        f'<a href="{link}" target="_blank" style="color: #667eea; text-decoration: none;">{link}</a></div>'
+        for i, (link, netloc) in enumerate(
+            filtered_links[offset:offset + LINKS_PER_PAGE], offset + 1
+        )
+    )
+    st.markdown(links_html, unsafe_allow_html=True)
+
+
 def main():
     # Header
     st.markdown("""
@@ -233,162 +430,80 @@ def main():
                     ⚠️ Invalid URL format! Please include http:// or https://
                 </div>
             """, unsafe_allow_html=True)
+        elif use_browser:
+            # Selenium takes seconds; run it off the script thread and poll for it
+            st.session_state['browser_job'] = (url_input, get_browser_executor().submit(
+                extract, url_input, timeout, filter_domain, include_external, True
+            ))
         else:
             with st.spinner("🔄 Extracting links... This may take a moment"):
                 try:
-                    extractor = LinkExtractor(url_input, timeout=timeout)
-                    
-                    if use_browser:
-                        links, diagnostics = extractor.extract_links_with_browser(
-                            filter_domain=filter_domain,
-                            include_external=include_external,
-                            wait_time=5
-                        )
-                    else:
-                        links, diagnostics = extractor.get_all_links(
-                            filter_domain=filter_domain,
-                            include_external=include_external
-                        )
-                    
-                    # Store diagnostics
-                    st.session_state['diagnostics'] = diagnostics
-                    
-                    if links:
-                        st.session_state['extracted_links'] = links
-                        st.session_state['source_url'] = url_input
-                        
-                        st.markdown(f"""
-                            <div class="success-message">
-                                ✅ Successfully extracted {len(links)} unique links!
-                            </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Show diagnostics in expander
-                        with st.expander("📊 Request Diagnostics"):
-                            st.json(diagnostics)
-                    else:
-                        # Show detailed error information
-                        error_msg = diagnostics.get('error', 'Unknown error')
-                        anchor_count = diagnostics.get('anchor_tags_found', 0)
-                        content_length = diagnostics.get('content_length', 0)
-                        status_code = diagnostics.get('status_code', 'N/A')
-                        
-                        error_html = f"""
-                            <div class="error-message">
-                                ⚠️ No links found on this page.
-                                <br><br>
-                                <strong>Details:</strong><br>
-                                • Status Code: {status_code}<br>
-                                • Content Length: {content_length:,} bytes<br>
-                                • Anchor Tags Found: {anchor_count}<br>
-                                • Error: {error_msg if error_msg else 'None'}
-                            </div>
-                        """
-                        
-                        st.markdown(error_html, unsafe_allow_html=True)
-                        
-                        # Provide helpful suggestions
-                        st.info("""
-                        **Possible reasons why no links were found:**
-                        - The page content is loaded dynamically with JavaScript (requires browser automation)
-                        - The website is blocking automated requests
-                        - The page requires authentication
-                        - The page structure doesn't use standard `<a>` tags
-                        - The page returned an error or empty content
-                        
-                        **Try:**
-                        - Increasing the timeout in settings
-                        - Checking if the URL is accessible in a browser
-                        - Trying a different page from the same website
-                        """)
-                        
-                        # Show diagnostics
-                        with st.expander("📊 Request Diagnostics"):
-                            st.json(diagnostics)
-                            
+                    links, diagnostics = extract(
+                        url_input, timeout, filter_domain, include_external, use_browser
+                    )
+                    render_extraction_result(url_input, links, diagnostics)
                 except Exception as e:
-                    st.markdown(f"""
-                        <div class="error-message">
-                            ❌ Error: {str(e)}
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.error(f"Full error details: {type(e).__name__}: {str(e)}")
+                    render_extraction_error(e)
+    
+    if 'browser_result' in st.session_state:
+        url, future = st.session_state.pop('browser_result')
+        try:
+            render_extraction_result(url, *future.result())
+        except Exception as e:
+            render_extraction_error(e)
+    
+    if 'browser_job' in st.session_state:
+        browser_job_status()
     
     # Display results
     if 'extracted_links' in st.session_state and st.session_state['extracted_links']:
         links = st.session_state['extracted_links']
         source_url = st.session_state.get('source_url', 'Unknown')
         
+        # Parse each link's host once per extraction, not on every rerun
+        netlocs = st.session_state.get('netlocs')
+        if netlocs is None:
+            netlocs = [_host(link) for link in links]
+            st.session_state['netlocs'] = netlocs
+            st.session_state['source_netloc'] = _host(source_url)
+        source_netloc = st.session_state['source_netloc']
+        
         # Statistics
         st.markdown("---")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-                <div class="stats-card">
-                    <div class="stats-number">{len(links)}</div>
-                    <div class="stats-label">Total Links</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # Count internal vs external links
-        internal_count = sum(1 for link in links if urlparse(link).netloc == urlparse(source_url).netloc)
+        # Count internal vs external links and distinct hosts in one pass
+        netloc_counts = Counter(netlocs)
+        internal_count = netloc_counts.get(source_netloc, 0)
         external_count = len(links) - internal_count
         
-        with col2:
-            st.markdown(f"""
-                <div class="stats-card">
-                    <div class="stats-number">{internal_count}</div>
-                    <div class="stats-label">Internal Links</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-                <div class="stats-card">
-                    <div class="stats-number">{external_count}</div>
-                    <div class="stats-label">External Links</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-                <div class="stats-card">
-                    <div class="stats-number">{len(set(urlparse(link).netloc for link in links))}</div>
-                    <div class="stats-label">Unique Domains</div>
-                </div>
-            """, unsafe_allow_html=True)
+        st.markdown(
+            '<div class="stats-row">' + "".join(
+                _stat_card(number, label) for number, label in [
+                    (len(links), "Total Links"),
+                    (internal_count, "Internal Links"),
+                    (external_count, "External Links"),
+                    (len(netloc_counts), "Unique Domains"),
+                ]
+            ) + '</div>',
+            unsafe_allow_html=True
+        )
         
         # Export options
         st.markdown("---")
         export_col1, export_col2 = st.columns([1, 1])
         
         with export_col1:
-            # Create text file content
-            links_text = "\n".join(links)
             st.download_button(
                 label="📥 Download as TXT",
-                data=links_text,
-                file_name=f"links_{urlparse(source_url).netloc.replace('.', '_')}.txt",
+                data=_to_txt(tuple(links)),
+                file_name=f"links_{source_netloc.replace('.', '_')}.txt",
                 mime="text/plain"
             )
         
         with export_col2:
-            # Create CSV content
-            import csv
-            import io
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(['#', 'URL'])
-            for i, link in enumerate(links, 1):
-                writer.writerow([i, link])
-            csv_content = output.getvalue()
-            
             st.download_button(
                 label="📊 Download as CSV",
-                data=csv_content,
-                file_name=f"links_{urlparse(source_url).netloc.replace('.', '_')}.csv",
+                data=_to_csv(tuple(links)),
+                file_name=f"links_{source_netloc.replace('.', '_')}.csv",
                 mime="text/csv"
             )
         
@@ -396,33 +511,10 @@ def main():
         st.markdown("---")
         st.markdown("### 📋 Extracted Links")
         
-        # Search/filter functionality
-        search_term = st.text_input("🔍 Filter links", placeholder="Search in URLs...")
-        
-        filtered_links = links
-        if search_term:
-            filtered_links = [link for link in links if search_term.lower() in link.lower()]
-            st.info(f"Showing {len(filtered_links)} of {len(links)} links")
-        
-        # Display links in a scrollable container
-        links_container = st.container()
-        with links_container:
-            for i, link in enumerate(filtered_links, 1):
-                domain = urlparse(link).netloc
-                is_internal = domain == urlparse(source_url).netloc
-                
-                badge = "🏠 Internal" if is_internal else "🌐 External"
-                badge_color = "#667eea" if is_internal else "#f5576c"
-                
-                st.markdown(f"""
-                    <div class="link-card">
-                        <strong>#{i}</strong> {badge}
-                        <br>
-                        <a href="{link}" target="_blank" style="color: #667eea; text-decoration: none;">
-                            {link}
-                        </a>
-                    </div>
-                """, unsafe_allow_html=True)
+        render_links()
+    
+    st.markdown("---")
+    batch_section(timeout, filter_domain, include_external)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# Start the Flask API server
-echo "Starting Flask API server on http://localhost:5000..."
+# Start the API server
+echo "Starting API server on http://localhost:5001..."
 python3 api.py &
 API_PID=$!
 
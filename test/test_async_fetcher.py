@@ -0,0 +1,95 @@
+"""
+Unit tests for Async Fetcher
+"""
+
+import unittest
+import importlib.util
+import asyncio
+import http.server
+import sys
+import os
+import threading
+
+# Fall back to the source tree when the package is not installed
+if importlib.util.find_spec('link_extractor') is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from async_fetcher import fetch_many
+from link_extractor import LinkExtractor
+
+PAGE_HTML = b"<html><a href='/x'>x</a><a href='https://other.com/y'>y</a></html>"
+LATIN1_HTML = "<html><a href='/caf\u00e9'>caf\u00e9</a></html>".encode('latin-1')
+
+
+class _PageHandler(http.server.BaseHTTPRequestHandler):
+    """Serves PAGE_HTML for every path except /missing and /latin1"""
+    
+    def do_GET(self):
+        if self.path == '/missing':
+            self.send_error(404)
+            return
+        body, charset = PAGE_HTML, 'utf-8'
+        if self.path == '/latin1':
+            body, charset = LATIN1_HTML, 'ISO-8859-1'
+        self.send_response(200)
+        self.send_header('Content-Type', f'text/html; charset={charset}')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+class TestAsyncFetcher(unittest.TestCase):
+    """Test cases for the async fetch helpers"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Serve test pages from a local HTTP server"""
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def test_fetch_many_keeps_input_order(self):
+        """Test that bodies and errors line up with the requested URLs"""
+        results = asyncio.run(fetch_many([self.base + "/", self.base + "/missing"]))
+        
+        (body, diagnostics), (missing, missing_diagnostics) = results
+        self.assertEqual(body, PAGE_HTML)
+        self.assertEqual(diagnostics['status_code'], 200)
+        self.assertIsNone(missing)
+        self.assertEqual(missing_diagnostics['status_code'], 404)
+        self.assertIn('error', missing_diagnostics)
+    
+    def test_fetch_many_reuses_given_session(self):
+        """Test that a caller's session is used and left open for the next call"""
+        async def fetch_twice():
+            async with LinkExtractor(self.base).new_client_session() as session:
+                first = await fetch_many([self.base + "/"], session=session)
+                second = await fetch_many([self.base + "/"], session=session)
+                return first + second, session.closed
+        
+        results, closed = asyncio.run(fetch_twice())
+        self.assertEqual([body for body, _ in results], [PAGE_HTML, PAGE_HTML])
+        self.assertFalse(closed)
+    
+    def test_fetched_charset_is_used_for_parsing(self):
+        """Test that the Content-Type charset reaches parse_links"""
+        url = self.base + "/latin1"
+        (body, diagnostics), = asyncio.run(fetch_many([url]))
+        self.assertEqual(diagnostics['charset'], 'ISO-8859-1')
+        
+        links, _ = LinkExtractor(url).parse_links(
+            body, diagnostics['final_url'], encoding=diagnostics['charset']
+        )
+        self.assertEqual(links, {self.base + "/caf\u00e9"})
+
+
+if __name__ == '__main__':
+    unittest.main()
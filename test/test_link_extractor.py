@@ -3,14 +3,120 @@ Unit tests for Link Extractor
 """
 
 import unittest
+import importlib.util
+import asyncio
+import codecs
+import http.server
 import sys
 import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import responses
 
+# Fall back to the source tree when the package is not installed
+if importlib.util.find_spec('link_extractor') is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import link_extractor
 from link_extractor import LinkExtractor
 
+# Fixed page served in place of https://example.com
+PAGE_HTML = "<html><a href='/x'>x</a><a href='https://other.com/y'>y</a></html>"
+
+
+class _PageHandler(http.server.BaseHTTPRequestHandler):
+    """Serves PAGE_HTML for every path"""
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(PAGE_HTML)))
+        self.end_headers()
+        self.wfile.write(PAGE_HTML.encode())
+    
+    def log_message(self, *args):
+        pass
+
+
+class _CookieHandler(http.server.BaseHTTPRequestHandler):
+    """Sets a session cookie on every response"""
+    
+    def do_GET(self):
+        body = PAGE_HTML.encode()
+        self.send_response(200)
+        self.send_header('Set-Cookie', 'sid=secret; Path=/')
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+class _Latin1Handler(http.server.BaseHTTPRequestHandler):
+    """Serves a Latin-1 page whose charset is only given in the header"""
+    
+    body = "<html><a href='/caf\u00e9'>caf\u00e9</a></html>".encode('latin-1')
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=ISO-8859-1')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+    
+    def log_message(self, *args):
+        pass
+
+
+class _SiteHandler(http.server.BaseHTTPRequestHandler):
+    """Serves a small linked site, recording every requested path"""
+    
+    pages = {
+        '/': ['/a', '/b', '/style.css', '/broken'],
+        '/a': ['/a1'],
+        '/b': ['/b1'],
+        '/a1': ['/deep'],
+        '/b1': [],
+        '/style.css': [],
+    }
+    requested = []
+    
+    def do_GET(self):
+        self.requested.append(self.path)
+        if self.path not in self.pages:
+            self.send_error(404)
+            return
+        body = ''.join(f'<a href="{href}">{href}</a>' for href in self.pages[self.path]).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+class _SlowHandler(http.server.BaseHTTPRequestHandler):
+    """Answers after longer than the test timeout, counting requests"""
+    
+    hits = []
+    
+    def do_GET(self):
+        self.hits.append(self.path)
+        time.sleep(1.5)
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(PAGE_HTML.encode())
+    
+    def log_message(self, *args):
+        pass
+
 
 class TestLinkExtractor(unittest.TestCase):
     """Test cases for LinkExtractor class"""
@@ -26,6 +132,11 @@ class TestLinkExtractor(unittest.TestCase):
         self.assertEqual(self.extractor.timeout, 10)
         self.assertIsNotNone(self.extractor.session)
     
+    def test_session_is_shared(self):
+        """Test that extractors reuse one pooled HTTP session"""
+        other = LinkExtractor("https://example.org")
+        self.assertIs(other.session, self.extractor.session)
+    
     def test_url_validation(self):
         """Test URL validation"""
         # Valid URLs
@@ -36,6 +147,12 @@ class TestLinkExtractor(unittest.TestCase):
         self.assertFalse(self.extractor._is_valid_url("not-a-url"))
         self.assertFalse(self.extractor._is_valid_url("javascript:alert(1)"))
         self.assertFalse(self.extractor._is_valid_url("mailto:test@example.com"))
+        
+        # Malformed URLs
+        self.assertFalse(self.extractor._is_valid_url("https://example.com/%22%3E%3C/a%3E"))
+        self.assertFalse(self.extractor._is_valid_url("https://example.com/https://example.org"))
+        self.assertFalse(self.extractor._is_valid_url('https://exa"mple.com/'))
+        self.assertTrue(self.extractor._is_valid_url("https://example.com/?next=http://example.org"))
     
     def test_same_domain_check(self):
         """Test domain comparison"""
@@ -52,25 +169,341 @@ class TestLinkExtractor(unittest.TestCase):
         cleaned = self.extractor._clean_url("javascript:alert(1)")
         self.assertIsNone(cleaned)
     
+    @responses.activate
     def test_extract_links_basic(self):
         """Test basic link extraction"""
+        responses.add(responses.GET, self.test_url, body=PAGE_HTML,
+                      status=200, content_type='text/html; charset=utf-8')
         links, diagnostics = self.extractor.get_all_links(include_external=True)
         
-        # Should extract at least some links
-        self.assertIsInstance(links, list)
-        self.assertIsInstance(diagnostics, dict)
-        self.assertIn('success', diagnostics)
+        self.assertEqual(links, ["https://example.com/x", "https://other.com/y"])
+        self.assertEqual(diagnostics['status_code'], 200)
+        self.assertEqual(diagnostics['anchor_tags_found'], 2)
+        self.assertTrue(diagnostics['success'])
     
+    @responses.activate
     def test_extract_links_filter_domain(self):
         """Test domain filtering"""
+        responses.add(responses.GET, self.test_url, body=PAGE_HTML,
+                      status=200, content_type='text/html; charset=utf-8')
         links, diagnostics = self.extractor.get_all_links(
             filter_domain=True,
             include_external=False
         )
         
-        # All links should be from the same domain
-        for link in links:
-            self.assertTrue(self.extractor._is_same_domain(link))
+        self.assertEqual(links, ["https://example.com/x"])
+    
+    def test_read_timeout_is_not_retried(self):
+        """Test that a slow server is requested once and reported as a timeout"""
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _SlowHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/slow"
+            links, diagnostics = LinkExtractor(url, timeout=1).extract_links()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        self.assertEqual(links, set())
+        self.assertEqual(diagnostics['error'], "Request timed out after 1 seconds.")
+        self.assertEqual(_SlowHandler.hits, ["/slow"])
+    
+    def test_shared_session_keeps_no_cookies(self):
+        """Test that cookies set for one extractor are not sent by the next"""
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _CookieHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        try:
+            links, diagnostics = LinkExtractor(url).extract_links()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        self.assertNotIn('error', diagnostics)
+        self.assertEqual(len(links), 2)
+        self.assertEqual(len(LinkExtractor(url).session.cookies), 0)
+    
+    def _crawl_site(self, **kwargs):
+        """Crawl the _SiteHandler site and return (links, diagnostics, base)"""
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _SiteHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        del _SiteHandler.requested[:]
+        try:
+            links, diagnostics = LinkExtractor(base + "/").crawl(max_workers=4, **kwargs)
+        finally:
+            server.shutdown()
+            server.server_close()
+        return links, diagnostics, base
+    
+    def test_crawl_follows_pages_to_depth(self):
+        """Test that crawl stops at depth, skips assets and collects errors"""
+        links, diagnostics, base = self._crawl_site(depth=1)
+        
+        self.assertEqual(sorted(_SiteHandler.requested), ['/', '/a', '/b', '/broken'])
+        self.assertEqual(links, {
+            base + path for path in ('/a', '/b', '/style.css', '/broken', '/a1', '/b1')
+        })
+        self.assertEqual(diagnostics['pages_crawled'], 4)
+        self.assertEqual(diagnostics['pages_failed'], 1)
+        self.assertEqual(list(diagnostics['errors']), [base + '/broken'])
+        self.assertTrue(diagnostics['success'])
+    
+    def test_crawl_respects_max_pages(self):
+        """Test that crawl fetches no more than max_pages pages"""
+        links, diagnostics, base = self._crawl_site(depth=2, max_pages=5)
+        
+        self.assertEqual(sorted(_SiteHandler.requested), ['/', '/a', '/a1', '/b', '/broken'])
+        self.assertEqual(diagnostics['pages_crawled'], 5)
+        self.assertIn(base + '/deep', links)
+    
+    def test_parse_links_sources(self):
+        """Test that links are collected from every supported tag"""
+        html = b"""
+            <html><head>
+                <link rel="canonical" href="https://example.com/canonical">
+                <script type="application/ld+json">{"url": "https://example.com/ld"}</script>
+            </head><body>
+                <div><p><a href="/page">Page</a></p></div>
+                <a routerlink="/spa">SPA</a>
+                <div data-href="/row">Row</div>
+                <a href="mailto:test@example.com">Mail</a>
+                <script>var api = "https://api.example.com/v1";</script>
+            </body></html>
+        """
+        diagnostics = {}
+        links = self.extractor._parse_links(
+            html, "https://example.com/", True, True, diagnostics
+        )
+        
+        self.assertEqual(links, {
+            "https://example.com/canonical",
+            "https://example.com/ld",
+            "https://example.com/page",
+            "https://example.com/spa",
+            "https://example.com/row",
+            "https://api.example.com/v1",
+        })
+        self.assertEqual(diagnostics['anchor_tags_found'], 2)
+    
+    def test_parse_links_with_leading_comment(self):
+        """Test that a comment before <html> does not abort parsing"""
+        html = b'<!DOCTYPE html><!-- x --><html><body><a href="/a">a</a></body></html>'
+        diagnostics = {}
+        links = self.extractor._parse_links(
+            html, "https://example.com/", True, True, diagnostics
+        )
+        
+        self.assertEqual(links, {"https://example.com/a"})
+        self.assertNotIn('error', diagnostics)
+    
+    def test_parse_links_with_xml_declaration(self):
+        """Test that an XML declaration before <html> does not abort parsing"""
+        html = b'<?xml version="1.0" encoding="utf-8"?>\n<html><body><a href="/a">a</a></body></html>'
+        diagnostics = {}
+        links = self.extractor._parse_links(
+            html, "https://example.com/", True, True, diagnostics
+        )
+        
+        self.assertEqual(links, {"https://example.com/a"})
+        self.assertNotIn('error', diagnostics)
+    
+    def test_parse_links_in_deeply_nested_markup(self):
+        """Test that links past libxml2's default depth limit are found"""
+        html = b'<html><body>' + b'<font><b><span>' * 100 + b'<a href="/z">z</a></body></html>'
+        diagnostics = {}
+        links = self.extractor._parse_links(
+            html, "https://example.com/", True, True, diagnostics
+        )
+        
+        self.assertEqual(links, {"https://example.com/z"})
+    
+    def test_parse_links_honours_byte_order_mark(self):
+        """Test that a BOM selects the encoding when no charset is declared"""
+        html = codecs.BOM_UTF16_LE + '<html><body><a href="/café">x</a></body></html>'.encode('utf-16-le')
+        diagnostics = {}
+        links = self.extractor._parse_links(
+            html, "https://example.com/", True, True, diagnostics
+        )
+        
+        self.assertEqual(links, {"https://example.com/café"})
+    
+    def test_json_ld_urls(self):
+        """Test that JSON-LD URLs are found in nested URL properties only"""
+        document = """{
+            "@context": "https://schema.org",
+            "@graph": [{
+                "@type": "Organization",
+                "url": "https://example.com/#org",
+                "logo": {"@type": "ImageObject", "url": "https://example.com/logo.png"},
+                "sameAs": ["https://twitter.com/example", "https://github.com/example"],
+                "description": "https://example.com/not-a-link-property"
+            }]
+        }"""
+        links = self.extractor._extract_links_from_json_ld(document)
+        
+        self.assertEqual(links, {
+            "https://example.com/",
+            "https://example.com/logo.png",
+            "https://twitter.com/example",
+            "https://github.com/example",
+        })
+        self.assertEqual(self.extractor._extract_links_from_json_ld("not json"), set())
+    
+    def test_released_driver_is_reused(self):
+        """Test that browsers are reset and pooled instead of quit"""
+        class FakeDriver:
+            current_url = "https://example.com/page"
+            
+            def __init__(self):
+                self.calls = []
+            
+            def execute_cdp_cmd(self, cmd, params):
+                self.calls.append((cmd, params))
+            
+            def get(self, url):
+                self.calls.append(url)
+            
+            def quit(self):
+                self.calls.append('quit')
+        
+        driver = FakeDriver()
+        link_extractor._release_driver(driver)
+        reused, source = link_extractor._get_driver()
+        
+        self.assertIs(reused, driver)
+        self.assertEqual(source, 'pool')
+        self.assertEqual(driver.calls, [
+            ('Network.clearBrowserCookies', {}),
+            ('Storage.clearDataForOrigin', {
+                'origin': 'https://example.com', 'storageTypes': 'all'
+            }),
+            'about:blank',
+        ])
+    
+    def test_extract_links_batch_reports_errors_per_url(self):
+        """Test that batch extraction returns one result per URL"""
+        urls = ["http://127.0.0.1:9/a", "http://127.0.0.1:9/b"]
+        results = asyncio.run(self.extractor.extract_links_batch(urls))
+        
+        self.assertEqual(list(results), urls)
+        for links, diagnostics in results.values():
+            self.assertEqual(links, set())
+            self.assertIn('error', diagnostics)
+
+    
+    def test_extract_links_batch_filters_each_page_by_its_own_domain(self):
+        """Test that a mixed-host batch keeps each page's internal links"""
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_address[1]
+        urls = [f"http://127.0.0.1:{port}/", f"http://localhost:{port}/"]
+        try:
+            extractor = LinkExtractor(urls[0])
+            results = asyncio.run(extractor.extract_links_batch(
+                urls, filter_domain=True, include_external=False,
+                parse_in_processes=False
+            ))
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        self.assertEqual(results[urls[0]][0], {f"http://127.0.0.1:{port}/x"})
+        self.assertEqual(results[urls[1]][0], {f"http://localhost:{port}/x"})
+    
+    def test_extract_links_batch_reports_progress(self):
+        """Test that on_done fires once per URL, failures included"""
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        urls = [f"http://127.0.0.1:{server.server_address[1]}/", "http://127.0.0.1:9/"]
+        finished = {}
+        try:
+            results = asyncio.run(self.extractor.extract_links_batch(
+                urls, max_concurrency=1, parse_in_processes=False,
+                on_done=lambda url, links, diagnostics: finished.setdefault(url, links)
+            ))
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        self.assertEqual(finished, {url: links for url, (links, _) in results.items()})
+        self.assertEqual(len(finished[urls[0]]), 2)
+        self.assertIn('error', results[urls[1]][1])
+
+    
+    def test_extract_links_batch_parses_on_process_pool(self):
+        """Test the process-pool parse path and recovery from a broken pool"""
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        extractor = LinkExtractor(url)
+        
+        # A pool whose worker has died raises BrokenProcessPool on submit
+        broken = ProcessPoolExecutor(max_workers=1)
+        with self.assertRaises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result()
+        link_extractor._PARSE_POOL = broken
+        
+        try:
+            fallback = asyncio.run(extractor.extract_links_batch(
+                [url], parse_in_processes=True
+            ))
+            self.assertIsNone(link_extractor._PARSE_POOL)
+            
+            results = asyncio.run(extractor.extract_links_batch(
+                [url], parse_in_processes=True
+            ))
+            self.assertIsNotNone(link_extractor._PARSE_POOL)
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        expected = {url + "x", "https://other.com/y"}
+        for batch in (fallback, results):
+            links, diagnostics = batch[url]
+            self.assertEqual(links, expected)
+            self.assertEqual(diagnostics['anchor_tags_found'], 2)
+            self.assertEqual(diagnostics['content_length'], len(PAGE_HTML))
+    
+    def test_extract_links_batch_reuses_given_session(self):
+        """Test that a caller's aiohttp session is used and left open"""
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        extractor = LinkExtractor(url)
+        
+        async def run_batch():
+            async with extractor.new_client_session() as session:
+                results = await extractor.extract_links_batch(
+                    [url], parse_in_processes=False, session=session
+                )
+                return results, session.closed
+        
+        try:
+            results, closed = asyncio.run(run_batch())
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        self.assertFalse(closed)
+        self.assertEqual(results[url][0], {url + "x", "https://other.com/y"})
+    
+    def test_extract_links_batch_process_pool_keeps_charset(self):
+        """Test that the response charset reaches the parse worker"""
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Latin1Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            results = asyncio.run(LinkExtractor(base).extract_links_batch(
+                [base + "/"], parse_in_processes=True
+            ))
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        links, diagnostics = results[base + "/"]
+        self.assertEqual(diagnostics['charset'], 'ISO-8859-1')
+        self.assertEqual(links, {base + "/caf\u00e9"})
 
 
 if __name__ == '__main__':